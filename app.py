@@ -32,28 +32,39 @@ test_cases = [
     {'input': 'A+B C+D', 'language': 'english', 'expected': 'error'}
 ]
 
-results = []
-passed = 0
+@st.cache_data
+def _run_fixed_tests(english_words, french_words):
+    # Test inputs are static, so results only change with the dictionaries.
+    checker = BrailleAutocorrect()
+    checker.load_dictionary(english_words, 'english')
+    checker.load_dictionary(french_words, 'french')
 
-for test in test_cases:
-    autocorrect.corrections.clear()
-    try:
-        actual = autocorrect.process_input(test['input'], test['language'])
-        pass_status = actual == test['expected']
-    except ValueError:
-        actual = 'error'
-        pass_status = test['expected'] == 'error'
-
-    if pass_status:
-        passed += 1
-
-    results.append({
-        'Input': test['input'],
-        'Lang': test['language'],
-        'Expected': str(test['expected']),
-        'Got': str(actual),
-        'Pass': '✅' if pass_status else '❌'
-    })
+    results = []
+    passed = 0
+
+    for test in test_cases:
+        checker.reset_corrections()
+        try:
+            actual = checker.process_input(test['input'], test['language'])
+            pass_status = actual == test['expected']
+        except ValueError:
+            actual = 'error'
+            pass_status = test['expected'] == 'error'
+
+        if pass_status:
+            passed += 1
+
+        results.append({
+            'Input': test['input'],
+            'Lang': test['language'],
+            'Expected': str(test['expected']),
+            'Got': str(actual),
+            'Pass': '✅' if pass_status else '❌'
+        })
+
+    return results, passed
+
+results, passed = _run_fixed_tests(tuple(english_words), tuple(french_words))
 
 # Display results table
 st.dataframe(results, use_container_width=True)
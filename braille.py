@@ -1,15 +1,21 @@
-import re
+from bisect import insort
 from collections import defaultdict
-import heapq
+from functools import lru_cache
 import sys
 
-# Unbuffered I/O for interactive mode
-sys.stdout.reconfigure(line_buffering=True)
-sys.stdin.reconfigure(line_buffering=True)
+# Each Braille cell is a 6-bit mask: bit d-1 is set when dot d is raised.
+KEY_TO_BIT = {'D': 1, 'W': 2, 'Q': 4, 'K': 8, 'O': 16, 'P': 32}
 
-DOT_TO_KEY = {1: 'D', 2: 'W', 3: 'Q', 4: 'K', 5: 'O', 6: 'P'}
+# Raised-dot count for every possible cell mask.
+POPCOUNT = [mask.bit_count() for mask in range(64)]
 
-ENGLISH_BRAILLE = {
+def dots_to_mask(dots):
+    mask = 0
+    for dot in dots:
+        mask |= 1 << (dot - 1)
+    return mask
+
+ENGLISH_BRAILLE = {char: dots_to_mask(dots) for char, dots in {
     'a': [1], 'b': [1, 2], 'c': [1, 4], 'd': [1, 4, 5], 'e': [1, 5],
     'f': [1, 2, 4], 'g': [1, 2, 4, 5], 'h': [1, 2, 5], 'i': [2, 4],
     'j': [2, 4, 5], 'k': [1, 3], 'l': [1, 2, 3], 'm': [1, 3, 4],
@@ -17,39 +23,155 @@ ENGLISH_BRAILLE = {
     'r': [1, 2, 3, 5], 's': [2, 3, 4], 't': [2, 3, 4, 5], 'u': [1, 3, 6],
     'v': [1, 2, 3, 6], 'w': [2, 4, 5, 6], 'x': [1, 3, 4, 6], 'y': [1, 3, 4, 5, 6],
     'z': [1, 3, 5, 6]
-}
+}.items()}
 
-FRENCH_BRAILLE = ENGLISH_BRAILLE.copy()
+# French uses the same a-z cells, so every language shares one lookup
+# indexed by ord(char) - ord('a').
+CHAR_TO_MASK = bytes(ENGLISH_BRAILLE[chr(ord('a') + i)] for i in range(26))
+
+# Slack for float comparisons when pruning candidates against a cutoff.
+CUTOFF_EPSILON = 1e-9
 
 CONTRACTIONS = {
-    'the': [2, 3, 4, 6]
+    'the': dots_to_mask([2, 3, 4, 6])
 }
 
+@lru_cache(maxsize=256)
+def _keys_to_dots(keys):
+    if not keys:
+        return 0
+    key_list = keys.split('+')
+    mask = 0
+    for key in key_list:
+        bit = KEY_TO_BIT.get(key)
+        if bit is None:
+            valid_keys = set(KEY_TO_BIT)
+            raise ValueError(f"Invalid keys detected: {set(key_list) - valid_keys}. Valid keys are {valid_keys}.")
+        mask |= bit
+    return mask
+
+@lru_cache(maxsize=1024)
+def _encode_word(word):
+    """Dot masks for each letter of ``word``; characters outside a-z map to 0."""
+    masks = []
+    for char in word.lower():
+        index = ord(char) - 97
+        masks.append(CHAR_TO_MASK[index] if 0 <= index < 26 else 0)
+    return tuple(masks)
+
+@lru_cache(maxsize=256)
+def _input_to_braille(input_seq):
+    return tuple(_keys_to_dots(keys) for keys in input_seq.split())
+
+def dot_distance(dots1, dots2):
+    """Smarter similarity: normalized distance based on overlap."""
+    intersection = POPCOUNT[dots1 & dots2]
+    union = POPCOUNT[dots1 | dots2]
+    if union == 0:
+        return 1.0
+    return 1 - (intersection / union)
+
+# SUB_TABLE[a][b] is the substitution cost between cell masks a and b.
+SUB_TABLE = [[dot_distance(a, b) for b in range(64)] for a in range(64)]
+
+def _levenshtein(long_dots, short_dots, sub_table, cutoff=float('inf'), rows=None):
+    """Weighted edit distance; both rows are reused instead of rebuilt per cell.
+
+    ``rows`` may supply two scratch lists of at least ``len(short_dots) + 1``
+    items so repeated calls share buffers. Returns inf as soon as a whole row
+    exceeds ``cutoff``, since the final distance can never be smaller than
+    the minimum of any row.
+    """
+    n = len(short_dots)
+    if rows is None:
+        previous_row, current_row = [0] * (n + 1), [0] * (n + 1)
+    else:
+        previous_row, current_row = rows
+    previous_row[:n + 1] = range(n + 1)
+    for i, c1 in enumerate(long_dots, 1):
+        current_row[0] = left = row_min = i
+        costs = sub_table[c1]
+        for j, c2 in enumerate(short_dots):
+            value = previous_row[j] + costs[c2]
+            insertion = previous_row[j + 1] + 1
+            if insertion < value:
+                value = insertion
+            if left + 1 < value:
+                value = left + 1
+            current_row[j + 1] = left = value
+            if value < row_min:
+                row_min = value
+        if row_min > cutoff:
+            return float('inf')
+        previous_row, current_row = current_row, previous_row
+    return previous_row[n]
+
+# Cheapest cost of any edit between distinct cells. Every edit in the weighted
+# DP costs at least this much, so MIN_EDIT_COST * unit-cost distance is a
+# lower bound on the weighted distance.
+MIN_EDIT_COST = min(1, min(cost for a, row in enumerate(SUB_TABLE)
+                           for b, cost in enumerate(row) if b != a))
+
+def _myers_peq(pattern):
+    """Bit-vector of pattern positions for every possible cell mask."""
+    peq = [0] * 64
+    for i, dots in enumerate(pattern):
+        peq[dots] |= 1 << i
+    return peq
+
+def _myers(peq, m, text):
+    """Unit-cost edit distance (Myers/Hyyro bit-parallel) between a pattern of
+    ``m`` cells, encoded by ``_myers_peq``, and ``text``."""
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv, mv, score = full, 0, m
+    for dots in text:
+        eq = peq[dots]
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+    return score
+
 class TrieNode:
     def __init__(self):
         self.children = {}
         self.is_end = False
         self.word = None
+        self.word_lower = None
 
 class BrailleAutocorrect:
     def __init__(self):
         self.dictionaries = defaultdict(TrieNode)
-        self.corrections = defaultdict(int)
-        self.braille_maps = {
-            'english': ENGLISH_BRAILLE,
-            'french': FRENCH_BRAILLE
-        }
+        # Flat (dot_sequence, word, word_lower) list per language, rebuilt from the trie.
+        self.word_entries = {}
+        self.corrections = {}
+        # Scratch DP rows shared by every levenshtein_distance call.
+        self._rows = ([0], [0])
         self.contractions = CONTRACTIONS
+        # Bumped whenever corrections change so cached suggestions go stale.
+        self._version = 0
+        self._suggest_cached = lru_cache(maxsize=1024)(self._cached_suggestion)
 
     def add_word(self, word, language='english'):
         node = self.dictionaries[language]
-        for char in word.lower():
-            dots = tuple(self.braille_maps[language].get(char, []))
+        for dots in _encode_word(word):
             if dots not in node.children:
                 node.children[dots] = TrieNode()
             node = node.children[dots]
         node.is_end = True
         node.word = word
+        node.word_lower = word.lower()
+        self.word_entries.pop(language, None)
+        self._suggest_cached.cache_clear()
 
     def load_dictionary(self, words, language='english'):
         for word in words:
@@ -57,77 +179,151 @@ class BrailleAutocorrect:
         if language == 'english':
             for word, dots in self.contractions.items():
                 node = self.dictionaries[language]
-                if tuple(dots) not in node.children:
-                    node.children[tuple(dots)] = TrieNode()
-                node.children[tuple(dots)].is_end = True
-                node.children[tuple(dots)].word = word
+                if dots not in node.children:
+                    node.children[dots] = TrieNode()
+                node.children[dots].is_end = True
+                node.children[dots].word = word
+                node.children[dots].word_lower = word.lower()
+        self.word_entries[language] = self._index_words(language)
+        self._suggest_cached.cache_clear()
+        self._reserve_rows(max((len(dots) for dots, _, _ in self.word_entries[language]), default=0) + 1)
+
+    def _reserve_rows(self, size):
+        if len(self._rows[0]) < size:
+            self._rows = ([0] * size, [0] * size)
+
+    def _index_words(self, language):
+        entries = []
+        current = []
+        def dfs(node):
+            if node.is_end and node.word:
+                entries.append((tuple(current), node.word, node.word_lower))
+            depth = len(current)
+            for dots, child in node.children.items():
+                current.append(dots)
+                # Walk unary chains in one step instead of recursing per cell.
+                while len(child.children) == 1 and not child.is_end:
+                    (dots, child), = child.children.items()
+                    current.append(dots)
+                dfs(child)
+                del current[depth:]
+        dfs(self.dictionaries[language])
+        entries.sort(key=lambda entry: len(entry[0]))
+        return entries
+
+    def _entries(self, language):
+        entries = self.word_entries.get(language)
+        if entries is None:
+            entries = self.word_entries[language] = self._index_words(language)
+        return entries
 
     def keys_to_dots(self, keys):
-        if not keys:
-            return []
-        key_set = set(keys.split('+'))
-        valid_keys = set(DOT_TO_KEY.values())
-        if not key_set.issubset(valid_keys):
-            raise ValueError(f"Invalid keys detected: {key_set - valid_keys}. Valid keys are {valid_keys}.")
-        return sorted(dot for dot, key in DOT_TO_KEY.items() if key in key_set)
+        return _keys_to_dots(keys)
 
     def input_to_braille(self, input_seq):
-        return [self.keys_to_dots(keys) for keys in input_seq.split()]
+        return _input_to_braille(input_seq)
 
     def hamming_distance(self, dots1, dots2):
-        set1, set2 = set(dots1), set(dots2)
-        return len(set1.symmetric_difference(set2))
+        return POPCOUNT[dots1 ^ dots2]
 
     def normalized_dot_distance(self, dots1, dots2):
-        """Smarter similarity: normalized distance based on overlap."""
-        set1, set2 = set(dots1), set(dots2)
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
-        if union == 0:
-            return 1.0
-        return 1 - (intersection / union)
-
-    def levenshtein_distance(self, input_dots, word_dots):
+        return dot_distance(dots1, dots2)
+
+    def levenshtein_distance(self, input_dots, word_dots, cutoff=float('inf')):
+        """Distance plus length penalty; inf if it is known to exceed ``cutoff``."""
         len_diff_penalty = abs(len(input_dots) - len(word_dots)) * 0.5
         if len(input_dots) < len(word_dots):
             input_dots, word_dots = word_dots, input_dots
         if not word_dots:
             return len(input_dots) + len_diff_penalty
-
-        previous_row = range(len(word_dots) + 1)
-        for i, c1 in enumerate(input_dots):
-            current_row = [i + 1]
-            for j, c2 in enumerate(word_dots):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitution_cost = self.normalized_dot_distance(c1, c2)
-                substitutions = previous_row[j] + substitution_cost
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-        return previous_row[-1] + len_diff_penalty
+        if len(self._rows[0]) <= len(word_dots):
+            self._reserve_rows(len(word_dots) + 1)
+        dist = _levenshtein(input_dots, word_dots, SUB_TABLE,
+                            cutoff - len_diff_penalty + CUTOFF_EPSILON, self._rows)
+        return dist + len_diff_penalty
 
     def suggest_word(self, input_seq, language='english', max_suggestions=1):
+        if max_suggestions == 1:
+            return self._suggest_one(input_seq, language)
         input_dots = self.input_to_braille(input_seq)
-        if not input_dots:
+        if not input_dots or max_suggestions < 1:
             return []
+        input_len = len(input_dots)
+        peq = _myers_peq(input_dots)
         suggestions = []
-        def dfs(node, current_dots, word_path):
-            if node.is_end and node.word:
-                dist = self.levenshtein_distance(input_dots, current_dots)
-                learn_bonus = min(0.5, 0.1 * self.corrections[node.word.lower()])
-                score = dist - learn_bonus
-                heapq.heappush(suggestions, (score, dist, node.word))
-            for dots, child in node.children.items():
-                dfs(child, current_dots + [list(dots)], word_path + [dots])
-        dfs(self.dictionaries[language], [], [])
-        suggestions.sort()
-        return [word for _, _, word in suggestions[:max_suggestions]]
+        cutoff = float('inf')
+        # Entries are sorted by length. A word's edit distance is at least its
+        # length difference, so its score is at least 1.5 * len_diff - bonus.
+        # Once a cutoff exists, the bit-parallel unit-cost distance gives a
+        # second cheap lower bound before running the weighted DP.
+        corrections = self.corrections
+        for word_dots, word, word_lower in self._entries(language):
+            len_diff = abs(len(word_dots) - input_len)
+            learn_bonus = min(0.5, 0.1 * corrections.get(word_lower, 0))
+            if 1.5 * len_diff - learn_bonus > cutoff + CUTOFF_EPSILON:
+                if len(word_dots) > input_len and 1.5 * len_diff - 0.5 > cutoff + CUTOFF_EPSILON:
+                    break
+                continue
+            # The unit-cost distance is at most the longer length, so only run
+            # it when that could be enough to beat the cutoff.
+            slack = cutoff + CUTOFF_EPSILON + learn_bonus - 0.5 * len_diff
+            if MIN_EDIT_COST * max(input_len, len(word_dots)) > slack:
+                if MIN_EDIT_COST * _myers(peq, input_len, word_dots) > slack:
+                    continue
+            dist = self.levenshtein_distance(input_dots, word_dots, cutoff + learn_bonus)
+            candidate = (dist - learn_bonus, dist, word)
+            if len(suggestions) < max_suggestions or candidate < suggestions[-1]:
+                insort(suggestions, candidate)
+                del suggestions[max_suggestions:]
+                if len(suggestions) == max_suggestions:
+                    cutoff = suggestions[-1][0]
+        return [word for _, _, word in suggestions]
+
+    def _suggest_one(self, input_seq, language='english'):
+        """Single-best variant of suggest_word that tracks scalars instead of a list."""
+        input_dots = self.input_to_braille(input_seq)
+        if not input_dots:
+            return []
+        input_len = len(input_dots)
+        peq = _myers_peq(input_dots)
+        best_score = best_dist = cutoff = float('inf')
+        best_word = None
+        corrections = self.corrections
+        for word_dots, word, word_lower in self._entries(language):
+            len_diff = abs(len(word_dots) - input_len)
+            learn_bonus = min(0.5, 0.1 * corrections.get(word_lower, 0))
+            if 1.5 * len_diff - learn_bonus > cutoff + CUTOFF_EPSILON:
+                if len(word_dots) > input_len and 1.5 * len_diff - 0.5 > cutoff + CUTOFF_EPSILON:
+                    break
+                continue
+            # The unit-cost distance is at most the longer length, so only run
+            # it when that could be enough to beat the cutoff.
+            slack = cutoff + CUTOFF_EPSILON + learn_bonus - 0.5 * len_diff
+            if MIN_EDIT_COST * max(input_len, len(word_dots)) > slack:
+                if MIN_EDIT_COST * _myers(peq, input_len, word_dots) > slack:
+                    continue
+            dist = self.levenshtein_distance(input_dots, word_dots, cutoff + learn_bonus)
+            score = dist - learn_bonus
+            if score < best_score or (score == best_score and (dist, word) < (best_dist, best_word)):
+                best_score, best_dist, best_word = score, dist, word
+                cutoff = score
+        return [] if best_word is None else [best_word]
+
+    def _cached_suggestion(self, input_seq, language, version):
+        return tuple(self._suggest_one(input_seq, language))
 
     def learn_correction(self, input_seq, corrected_word):
-        self.corrections[corrected_word.lower()] += 1
+        key = corrected_word.lower()
+        self.corrections[key] = self.corrections.get(key, 0) + 1
+        self._version += 1
+
+    def reset_corrections(self):
+        """Forget learned corrections; use this rather than clearing corrections directly."""
+        self.corrections.clear()
+        self._version += 1
 
     def process_input(self, input_seq, language='english'):
-        return self.suggest_word(input_seq, language)
+        return list(self._suggest_cached(input_seq, language, self._version))
 
 def run_tests():
     autocorrect = BrailleAutocorrect()
@@ -153,7 +349,7 @@ def run_tests():
     ]
 
     for i, test in enumerate(test_cases, 1):
-        autocorrect.corrections.clear()
+        autocorrect.reset_corrections()
         try:
             result = autocorrect.process_input(test['input'], test['language'])
             print(f"Test {i}: Input: {test['input']} | Language: {test['language']}")
@@ -168,5 +364,8 @@ def run_tests():
                 print("Fail")
 
 if __name__ == "__main__":
+    # Unbuffered I/O for interactive mode
+    sys.stdout.reconfigure(line_buffering=True)
+    sys.stdin.reconfigure(line_buffering=True)
     print("Running all tests...")
     run_tests()
@@ -1,12 +1,7 @@
-import re
 from collections import defaultdict
 import heapq
 import sys
 
-# Ensure unbuffered input/output for interactive testing
-sys.stdout.reconfigure(line_buffering=True)
-sys.stdin.reconfigure(line_buffering=True)
-
 # Braille dot-to-qwert key mapping
 DOT_TO_KEY = {1: 'D', 2: 'W', 3: 'Q', 4: 'K', 5: 'O', 6: 'P'}
 
@@ -22,15 +17,7 @@ ENGLISH_BRAILLE = {
 }
 
 # French Braille mappings (complete A-Z)
-FRENCH_BRAILLE = {
-    'a': [1], 'b': [1, 2], 'c': [1, 4], 'd': [1, 4, 5], 'e': [1, 5],
-    'f': [1, 2, 4], 'g': [1, 2, 4, 5], 'h': [1, 2, 5], 'i': [2, 4],
-    'j': [2, 4, 5], 'k': [1, 3], 'l': [1, 2, 3], 'm': [1, 3, 4],
-    'n': [1, 3, 4, 5], 'o': [1, 3, 5], 'p': [1, 2, 3, 4], 'q': [1, 2, 3, 4, 5],
-    'r': [1, 2, 3, 5], 's': [2, 3, 4], 't': [2, 3, 4, 5], 'u': [1, 3, 6],
-    'v': [1, 2, 3, 6], 'w': [2, 4, 5, 6], 'x': [1, 3, 4, 6], 'y': [1, 3, 4, 5, 6],
-    'z': [1, 3, 5, 6]
-}
+FRENCH_BRAILLE = ENGLISH_BRAILLE.copy()
 
 # Braille contractions (English only, using standard Braille)
 CONTRACTIONS = {
@@ -129,7 +116,7 @@ class BrailleAutocorrect:
         if not input_dots:
             return []
         suggestions = []
-        def search_trie(node, current_dots, word_chars):
+        def search_trie(node, current_dots):
             if node.is_end and node.word:
                 distance = self.levenshtein_distance(input_dots, current_dots)
                 length_adjustment = abs(len(current_dots) - len(input_dots)) * 0.5
@@ -138,9 +125,9 @@ class BrailleAutocorrect:
                 # Store raw distance for tie-breaking
                 heapq.heappush(suggestions, (score, distance, node.word))
             for dots, child in node.children.items():
-                search_trie(child, current_dots + [dots], word_chars + [dots])
+                search_trie(child, current_dots + [dots])
 
-        search_trie(self.dictionaries[language], [], [])
+        search_trie(self.dictionaries[language], [])
         suggestions = sorted(suggestions, key=lambda x: (x[0], x[1], x[2]))
         return [word for _, _, word in suggestions[:max_suggestions]]
 
@@ -301,6 +288,9 @@ def interactive_test():
             print(f"Unexpected error: {e}")
 
 if __name__ == "__main__":
+    # Ensure unbuffered input/output for interactive testing
+    sys.stdout.reconfigure(line_buffering=True)
+    sys.stdin.reconfigure(line_buffering=True)
     print("Running predefined test cases...")
     run_tests()
     print("\nStarting interactive testing...")